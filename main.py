@@ -1,14 +1,27 @@
 from typing import Annotated
-from fastapi import Depends, FastAPI, HTTPException, Query, status, BackgroundTasks, Request
+from fastapi import Depends, FastAPI, HTTPException, Query, status, Request, Response
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import RedirectResponse, HTMLResponse
+from fastapi.responses import RedirectResponse, HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from sqlmodel import Field, Session, SQLModel, create_engine, select
-from enum import Enum
+from pydantic import field_serializer
+from sqlalchemy import Column, SmallInteger, event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlmodel import Field, Index, SQLModel, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from enum import IntEnum
 from datetime import datetime, timezone
 from argon2 import PasswordHasher
-import requests
+from argon2.exceptions import InvalidHashError, VerificationError, VerifyMismatchError
+from cachetools import TTLCache
+from functools import lru_cache
+import asyncio
+import hashlib
+import hmac
+import os
+import time
+import httpx
 import logging
 from contextlib import asynccontextmanager
 
@@ -17,10 +30,22 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class SpaceEventState(str, Enum):
-    OPEN = "open"
-    CLOSED = "closed"
-    UNKNOWN = "unknown"
+class SpaceEventState(IntEnum):
+    """Stored as a 1-byte integer; mapped to strings at the API boundary"""
+    CLOSED = 0
+    OPEN = 1
+    UNKNOWN = 2
+
+    @property
+    def label(self) -> str:
+        return _STATE_LABELS[self]
+
+
+_STATE_LABELS = {
+    SpaceEventState.CLOSED: "closed",
+    SpaceEventState.OPEN: "open",
+    SpaceEventState.UNKNOWN: "unknown",
+}
 
 
 class SpacePublic(SQLModel):
@@ -39,116 +64,299 @@ class SpacePublic(SQLModel):
 class Space(SpacePublic, table=True):
     basic_auth_password: str = Field()
     telegram_bot_token: str = Field(default=None, nullable=True)
+    # Denormalized pointer to the most recent SpaceEvent, kept current by
+    # the event endpoints so reads skip the ORDER BY entirely. A plain
+    # int rather than a foreign key to avoid a circular table dependency.
+    latest_event_id: int | None = Field(default=None, nullable=True)
 
 
 class SpaceEvent(SQLModel, table=True):
+    # Covers the hot "latest event for a space" lookups, which all do
+    # WHERE space_id = ? ORDER BY timestamp DESC
+    __table_args__ = (Index("ix_event_space_ts", "space_id", "timestamp"),)
+
     id: int | None = Field(default=None, primary_key=True)
     space_id: int = Field(foreign_key="space.id")
     timestamp: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc), index=True)
     state: SpaceEventState = Field(
-        sa_column_kwargs={"default": SpaceEventState.UNKNOWN})
+        default=SpaceEventState.UNKNOWN,
+        sa_column=Column(SmallInteger, default=int(SpaceEventState.UNKNOWN)))
     telegram_message_id: int | None = Field(default=None, nullable=True)
 
+    @field_serializer("state")
+    def serialize_state(self, state: SpaceEventState) -> str:
+        # Rows loaded from the DB carry a plain int here
+        return SpaceEventState(state).label
+
+
+# Argon2id parameters, overridable via environment. Defaults follow the
+# OWASP recommendation for a single-core server (m=19456 KiB, t=2, p=1);
+# tune them to hit a target verify latency on the deployment machine.
+ARGON2_TIME_COST = int(os.environ.get("ARGON2_TIME_COST", 2))
+ARGON2_MEMORY_COST = int(os.environ.get("ARGON2_MEMORY_COST", 19456))
+ARGON2_PARALLELISM = int(os.environ.get("ARGON2_PARALLELISM", 1))
+
+_password_hasher = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM)
+
 
 def hash_password(password: str) -> str:
     """Hash password using argon2id"""
-    return PasswordHasher().hash(password)
+    return _password_hasher.hash(password)
 
 
-def verify_password(hashed_password: str, password: str) -> bool:
-    """Verify password using argon2id"""
+@lru_cache(maxsize=2048)
+def _verify_cached(hashed_password: str, password: str) -> bool:
+    """Run the actual argon2id verification and cache the result.
+
+    Argon2 is deliberately expensive (tens of ms per call), so repeated
+    requests with the same credentials skip the memory-hard work.
+    """
     try:
-        return PasswordHasher().verify(hashed_password, password)
-    except:
+        return _password_hasher.verify(hashed_password, password)
+    except (VerifyMismatchError, VerificationError, InvalidHashError):
         return False
 
 
-def authenticate(credentials: HTTPBasicCredentials, session: Session, space: Space) -> bool:
+def verify_password(hashed_password: str, password: str) -> bool:
+    """Verify password using argon2id"""
+    return _verify_cached(hashed_password, password)
+
+
+# Space rows change rarely (only via manage.py), yet every door event
+# and lookup re-reads them. Cache them briefly; the TTL bounds staleness
+# after CLI edits.
+_space_by_id: TTLCache = TTLCache(maxsize=256, ttl=300)
+_space_by_name: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+
+async def get_space_by_id(session: AsyncSession, space_id: int) -> Space | None:
+    space = _space_by_id.get(space_id)
+    if space is None:
+        space = await session.get(Space, space_id)
+        if space is not None:
+            _space_by_id[space_id] = space
+            _space_by_name[space.name] = space
+    return space
+
+
+async def get_space_by_name(session: AsyncSession, space_name: str) -> Space | None:
+    space = _space_by_name.get(space_name)
+    if space is None:
+        space = await session.scalar(
+            select(Space).where(Space.name == space_name).limit(1))
+        if space is not None:
+            _space_by_id[space.id] = space
+            _space_by_name[space_name] = space
+    return space
+
+
+async def authenticate(credentials: HTTPBasicCredentials, session: AsyncSession, space: Space) -> bool:
     """Authenticate user using basic auth"""
     if not space:
         return False
-    if not verify_password(space.basic_auth_password, credentials.password):
-        return False
-    if credentials.username != space.name:
+    # Cheap constant-time username check first, so username-mismatch
+    # probes never reach the expensive argon2 work
+    if not hmac.compare_digest(
+            credentials.username.encode(), space.name.encode()):
         return False
-    return True
-
-
-def send_telegram_message(space, space_event, session):
-    """Send Telegram message about space event"""
-    if not space.telegram_enabled or not space.telegram_bot_token or not space.telegram_channel_id:
-        return
-    message = f"'{space.name}' door is {space_event.state.value}."
-    url = f"https://api.telegram.org/bot{space.telegram_bot_token}/sendMessage"
-    payload = {
-        "chat_id": space.telegram_channel_id,
-        "text": message
-    }
-    try:
-        response = requests.post(url, data=payload)
-        response.raise_for_status()
-        # Save the message ID to the event
-        resp_json = response.json()
-        if resp_json.get("ok"):
-            message_id = resp_json["result"]["message_id"]
-            space_event.telegram_message_id = message_id
-            session.add(space_event)
-            session.commit()
-        logger.info(
-            f"Telegram message sent successfully for space '{space.name}' for event '{space_event.state.value}'.")
-    except requests.RequestException as e:
-        logger.error(f"Failed to send Telegram message: {e}")
-
-
-def delete_telegram_message(space, session):
+    # Run the memory-hard argon2 work in a thread so it doesn't block
+    # the event loop
+    return await asyncio.to_thread(
+        verify_password, space.basic_auth_password, credentials.password)
+
+
+# Shared HTTP/2 client for the Telegram API, created in lifespan so one
+# TLS handshake is amortized across events
+_telegram_client: httpx.AsyncClient | None = None
+
+
+async def send_telegram_message(space_id: int, event_id: int):
+    """Send Telegram message about space event
+
+    Runs after the request context has closed, so it opens its own
+    short-lived session instead of borrowing the request-scoped one.
+    """
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        space = await session.get(Space, space_id)
+        space_event = await session.get(SpaceEvent, event_id)
+        if not space or not space_event:
+            return
+        if not space.telegram_enabled or not space.telegram_bot_token or not space.telegram_channel_id:
+            return
+        # state is a plain int on rows loaded from the DB
+        state_label = SpaceEventState(space_event.state).label
+        message = f"'{space.name}' door is {state_label}."
+        url = f"https://api.telegram.org/bot{space.telegram_bot_token}/sendMessage"
+        payload = {
+            "chat_id": space.telegram_channel_id,
+            "text": message
+        }
+        try:
+            response = await _telegram_client.post(url, data=payload)
+            response.raise_for_status()
+            # Save the message ID to the event
+            resp_json = response.json()
+            if resp_json.get("ok"):
+                message_id = resp_json["result"]["message_id"]
+                space_event.telegram_message_id = message_id
+                session.add(space_event)
+                await session.commit()
+            logger.info(
+                f"Telegram message sent successfully for space '{space.name}' for event '{state_label}'.")
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to send Telegram message: {e}")
+
+
+async def delete_telegram_message(space_id: int):
     """Delete previous Telegram message about space event"""
-    if not space.telegram_enabled or not space.telegram_bot_token or not space.telegram_channel_id:
-        return
-    # Get the latest event with telegram_message_id
-    latest_event = session.exec(
-        select(SpaceEvent)
-        .where(SpaceEvent.space_id == space.id, SpaceEvent.telegram_message_id != None)
-        .order_by(SpaceEvent.timestamp.desc())
-    ).first()
-    if not latest_event:
-        return
-    url = f"https://api.telegram.org/bot{space.telegram_bot_token}/deleteMessage"
-    payload = {
-        "chat_id": space.telegram_channel_id,
-        "message_id": latest_event.telegram_message_id
-    }
-    try:
-        response = requests.post(url, data=payload)
-        response.raise_for_status()
-        logger.info(
-            f"Telegram message deleted successfully for space '{space.name}'.")
-    except requests.RequestException as e:
-        logger.error(f"Failed to delete Telegram message: {e}")
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        space = await session.get(Space, space_id)
+        if not space:
+            return
+        if not space.telegram_enabled or not space.telegram_bot_token or not space.telegram_channel_id:
+            return
+        # Get the latest event with telegram_message_id
+        latest_event = await session.scalar(
+            select(SpaceEvent)
+            .where(SpaceEvent.space_id == space.id, SpaceEvent.telegram_message_id != None)
+            .order_by(SpaceEvent.timestamp.desc())
+            .limit(1))
+        if not latest_event:
+            return
+        url = f"https://api.telegram.org/bot{space.telegram_bot_token}/deleteMessage"
+        payload = {
+            "chat_id": space.telegram_channel_id,
+            "message_id": latest_event.telegram_message_id
+        }
+        try:
+            response = await _telegram_client.post(url, data=payload)
+            response.raise_for_status()
+            logger.info(
+                f"Telegram message deleted successfully for space '{space.name}'.")
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to delete Telegram message: {e}")
 
 
-sqlite_file_name = "database.db"
-sqlite_url = f"sqlite:///{sqlite_file_name}"
+async def update_telegram(space_id: int, event_id: int):
+    """Delete the previous Telegram message, then send the new one.
+
+    Sequential on purpose: running them concurrently could let the
+    delete's latest-message lookup find the message the send just
+    posted and remove it.
+    """
+    await delete_telegram_message(space_id)
+    await send_telegram_message(space_id, event_id)
 
-connect_args = {"check_same_thread": False}
-engine = create_engine(sqlite_url, connect_args=connect_args)
 
+# Telegram updates are queued by the event endpoints and processed by a
+# single worker task, so responses return without waiting for the
+# Telegram round-trip and API calls stay serialized.
+_telegram_queue: asyncio.Queue = asyncio.Queue()
+_telegram_worker: asyncio.Task | None = None
 
-def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
 
+async def telegram_worker():
+    """Consume queued (space_id, event_id) pairs and update Telegram"""
+    while True:
+        space_id, event_id = await _telegram_queue.get()
+        try:
+            await update_telegram(space_id, event_id)
+        except Exception as e:
+            logger.error(f"Telegram update failed: {e}")
+        finally:
+            _telegram_queue.task_done()
 
-def get_session():
-    with Session(engine) as session:
+
+sqlite_file_name = "database.db"
+sqlite_url = f"sqlite+aiosqlite:///{sqlite_file_name}"
+
+engine = create_async_engine(
+    sqlite_url,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=3600)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Set SQLite pragmas on every new connection.
+
+    WAL + NORMAL synchronous lets readers proceed concurrently with a
+    writer and halves the fsyncs per commit; the remaining pragmas keep
+    hot index pages in memory.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+async def create_db_and_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+        # create_all never alters existing tables, so databases created
+        # before the latest-event pointer lack the column; add it here
+        columns = (await conn.exec_driver_sql(
+            "PRAGMA table_info(space)")).fetchall()
+        if "latest_event_id" not in {column[1] for column in columns}:
+            await conn.exec_driver_sql(
+                "ALTER TABLE space ADD COLUMN latest_event_id INTEGER")
+        # Legacy databases stored state as TEXT. A plain UPDATE cannot
+        # convert them: the old column's text affinity would turn the
+        # integers straight back into strings, so rebuild the table with
+        # the current schema and copy the rows across
+        event_columns = (await conn.exec_driver_sql(
+            "PRAGMA table_info(spaceevent)")).fetchall()
+        state_type = next(
+            (column[2] for column in event_columns if column[1] == "state"), "")
+        if state_type and state_type.upper() != "SMALLINT":
+            await conn.exec_driver_sql(
+                "ALTER TABLE spaceevent RENAME TO spaceevent_legacy")
+            await conn.exec_driver_sql(
+                "DROP INDEX IF EXISTS ix_spaceevent_timestamp")
+            await conn.exec_driver_sql(
+                "DROP INDEX IF EXISTS ix_event_space_ts")
+            await conn.run_sync(SQLModel.metadata.create_all)
+            # The old Enum column stored member names ('OPEN'); upper()
+            # also covers value spellings ('open') and leaves the
+            # stringified integers alone
+            await conn.exec_driver_sql(
+                "INSERT INTO spaceevent (id, space_id, timestamp, state, telegram_message_id) "
+                "SELECT id, space_id, timestamp, CASE "
+                f"WHEN upper(state) IN ('OPEN', '{int(SpaceEventState.OPEN)}') THEN {int(SpaceEventState.OPEN)} "
+                f"WHEN upper(state) IN ('CLOSED', '{int(SpaceEventState.CLOSED)}') THEN {int(SpaceEventState.CLOSED)} "
+                f"ELSE {int(SpaceEventState.UNKNOWN)} END, "
+                "telegram_message_id FROM spaceevent_legacy")
+            await conn.exec_driver_sql("DROP TABLE spaceevent_legacy")
+
+
+async def get_session():
+    async with AsyncSession(engine, expire_on_commit=False) as session:
         yield session
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    create_db_and_tables()
+    global _telegram_client, _telegram_worker
+    _telegram_client = httpx.AsyncClient(
+        http2=True,
+        timeout=5.0,
+        limits=httpx.Limits(max_keepalive_connections=10))
+    _telegram_worker = asyncio.create_task(telegram_worker())
+    await create_db_and_tables()
     # Create a default space for testing
-    with Session(engine) as session:
-        space = session.exec(select(Space).where(Space.id == 1)).first()
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        space = (await session.exec(select(Space).where(Space.id == 1))).first()
         if not space:
             hashed_password = hash_password("dummy_password")
             default_space = Space(
@@ -163,18 +371,25 @@ async def lifespan(app: FastAPI):
                 contact_email="modeemi@example.org"
             )
             session.add(default_space)
-            session.commit()
+            await session.commit()
             # Add an initial unknown event
             initial_event = SpaceEvent(
                 space_id=1, state=SpaceEventState.UNKNOWN)
             session.add(initial_event)
-            session.commit()
+            await session.flush()
+            default_space.latest_event_id = initial_event.id
+            await session.commit()
     yield
+    # Finish queued Telegram updates before tearing the client down
+    await _telegram_queue.join()
+    _telegram_worker.cancel()
+    await _telegram_client.aclose()
 
-SessionDep = Annotated[Session, Depends(get_session)]
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
 
 app = FastAPI(lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson is much faster than json
     docs_url=None,     # disables Swagger UI
     redoc_url=None,    # disables ReDoc
     openapi_url=None   # optionally disables the OpenAPI schema endpoint
@@ -193,12 +408,12 @@ def main_page():
     return RedirectResponse(url="/status")
 
 @app.get("/status")
-def status(request: Request, session: SessionDep):
-    spaces_from_db = session.exec(select(Space)).all()
+async def status_page(request: Request, session: SessionDep):
+    spaces_from_db = (await session.exec(select(Space))).all()
     spaces_dict = {}
     spaces_counter = 1
     for space_idx in spaces_from_db:
-        latest_event = session.exec(select(SpaceEvent).where(SpaceEvent.space_id == space_idx.id).order_by(SpaceEvent.timestamp.desc())).first()
+        latest_event = await session.scalar(select(SpaceEvent).where(SpaceEvent.space_id == space_idx.id).order_by(SpaceEvent.timestamp.desc()).limit(1))
         if latest_event.state == SpaceEventState.OPEN:
             current_state = "open"
         elif latest_event.state == SpaceEventState.CLOSED:
@@ -217,105 +432,191 @@ def tech(request: Request):
 
 
 @app.get("/space/by_id/{space_id}")
-def read_space(space_id: int, session: SessionDep) -> Space:
-    space = session.get(Space, space_id)
+async def read_space(space_id: int, session: SessionDep) -> Space:
+    space = await get_space_by_id(session, space_id)
     if not space:
         raise HTTPException(status_code=404, detail="Space not found")
     return space
 
 
 @app.get("/space/by_name/{space_name}", response_model=SpacePublic)
-def read_space_by_name(space_name: str, session: SessionDep) -> Space:
-    space = session.exec(select(Space).where(Space.name == space_name)).first()
+async def read_space_by_name(space_name: str, session: SessionDep) -> Space:
+    space = await get_space_by_name(session, space_name)
     if not space:
         raise HTTPException(status_code=404, detail="Space not found")
     return space
 
 
 @app.post("/space_events/{space_id}/open", response_model=SpaceEvent)
-async def open_space(space_id: int, session: SessionDep, credentials: Annotated[HTTPBasicCredentials, Depends(security)], background_tasks: BackgroundTasks) -> SpaceEvent:
-    space = session.get(Space, space_id)
-    if not authenticate(credentials, session, space):
+async def open_space(space_id: int, session: SessionDep, credentials: Annotated[HTTPBasicCredentials, Depends(security)]) -> SpaceEvent:
+    space = await get_space_by_id(session, space_id)
+    if not await authenticate(credentials, session, space):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     event = SpaceEvent(space_id=space_id, state=SpaceEventState.OPEN)
     session.add(event)
-    session.commit()
-    session.refresh(event)
+    await session.flush()
+    # Keep the materialized latest-event pointer (and the cached Space
+    # copy) in step with the new event
+    space.latest_event_id = event.id
+    await session.exec(update(Space).where(Space.id == space_id)
+                       .values(latest_event_id=event.id))
+    await session.commit()
+    await session.refresh(event)
     logger.info(f"Space '{space.name}' opened.")
-    delete_telegram_message(space, session)
-    background_tasks.add_task(send_telegram_message, space, event, session)
+    invalidate_space_api_cache(space.name)
+    await _telegram_queue.put((space_id, event.id))
     return event
 
 
 @app.post("/space_events/{space_id}/close", response_model=SpaceEvent)
-def close_space(space_id: int, session: SessionDep, credentials: Annotated[HTTPBasicCredentials, Depends(security)], background_tasks: BackgroundTasks) -> SpaceEvent:
-    space = session.get(Space, space_id)
-    if not authenticate(credentials, session, space):
+async def close_space(space_id: int, session: SessionDep, credentials: Annotated[HTTPBasicCredentials, Depends(security)]) -> SpaceEvent:
+    space = await get_space_by_id(session, space_id)
+    if not await authenticate(credentials, session, space):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
     event = SpaceEvent(space_id=space_id, state=SpaceEventState.CLOSED)
     session.add(event)
-    session.commit()
-    session.refresh(event)
+    await session.flush()
+    # Keep the materialized latest-event pointer (and the cached Space
+    # copy) in step with the new event
+    space.latest_event_id = event.id
+    await session.exec(update(Space).where(Space.id == space_id)
+                       .values(latest_event_id=event.id))
+    await session.commit()
+    await session.refresh(event)
     logger.info(f"Space '{space.name}' closed.")
-    delete_telegram_message(space, session)
-    background_tasks.add_task(send_telegram_message, space, event, session)
+    invalidate_space_api_cache(space.name)
+    await _telegram_queue.put((space_id, event.id))
     return event
 
 
 @app.get("/space_events/{space_id}")
-def read_space_events(
+async def read_space_events(
     space_id: int,
     session: SessionDep,
-    skip: int = 0,
-    limit: int = Query(default=100, lte=1000)
+    after: datetime | None = None,
+    limit: int = Query(default=100, le=1000)
 ):
-    events = session.exec(
-        select(SpaceEvent).where(SpaceEvent.space_id ==
-                                 space_id).offset(skip).limit(limit)
-    ).all()
-    return events
+    # Keyset pagination: pass the returned next_cursor as "after" to get
+    # the following page. Unlike OFFSET, this stays an index walk no
+    # matter how deep the page.
+    statement = (
+        select(SpaceEvent)
+        .where(SpaceEvent.space_id == space_id)
+        .order_by(SpaceEvent.timestamp.desc())
+        .limit(limit)
+    )
+    if after is not None:
+        statement = statement.where(SpaceEvent.timestamp < after)
+    events = (await session.exec(statement)).all()
+    next_cursor = events[-1].timestamp.isoformat() if events else None
+    return {"events": events, "next_cursor": next_cursor}
+
+
+def make_etag(space_id: int, latest_event: SpaceEvent | None) -> str:
+    """Build a strong ETag that changes whenever the latest event does"""
+    event_id = latest_event.id if latest_event else None
+    event_ts = latest_event.timestamp.timestamp() if latest_event else None
+    return hashlib.blake2b(
+        f"{space_id}:{event_id}:{event_ts}".encode(),
+        digest_size=16).hexdigest()
+
+
+CACHE_CONTROL = "public, s-maxage=30"
+
+# In-process cache for space.json responses. The payload only changes on
+# open/close events, which invalidate the entry; the TTL covers edits
+# made through manage.py.
+SPACE_API_CACHE_TTL = 10.0
+_space_api_cache: dict[str, tuple[float, str, dict]] = {}
+
+
+def invalidate_space_api_cache(space_name: str):
+    _space_api_cache.pop(space_name, None)
+
+
+# Everything in the space.json payload except "state" is static per
+# Space row, so prebuild it once and only fill in the dynamic part per
+# request. Same TTL as the Space row caches.
+_space_skeleton: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+
+def get_space_skeleton(space: Space) -> dict:
+    skeleton = _space_skeleton.get(space.id)
+    if skeleton is None:
+        skeleton = {
+            "api_compatibility": ["15"],
+            "space": space.name,
+            "logo": space.logo,
+            "url": space.url,
+            "location": {
+                "address": space.address,
+                "lat": space.lat,
+                "lon": space.lon
+            },
+            "contact": {
+                "email": space.contact_email
+            }
+        }
+        _space_skeleton[space.id] = skeleton
+    return skeleton
 
 
 @app.get("/space_events/{space_id}/latest", response_model=SpaceEvent)
-def read_latest_space_event(space_id: int, session: SessionDep):
-    event = session.exec(
-        select(SpaceEvent).where(SpaceEvent.space_id ==
-                                 space_id).order_by(SpaceEvent.timestamp.desc())
-    ).first()
+async def read_latest_space_event(space_id: int, request: Request, response: Response, session: SessionDep):
+    space = await get_space_by_id(session, space_id)
+    event = None
+    if space and space.latest_event_id:
+        event = await session.get(SpaceEvent, space.latest_event_id)
+    if not event:
+        # Fall back to the index walk for events written before the
+        # latest-event pointer existed
+        event = await session.scalar(
+            select(SpaceEvent).where(SpaceEvent.space_id ==
+                                     space_id).order_by(SpaceEvent.timestamp.desc())
+            .limit(1))
     if not event:
         raise HTTPException(
             status_code=404, detail="No events found for this space")
+    etag = make_etag(space_id, event)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
     return event
 
 
 # SpaceAPI response
 @app.get("/space/{space_name}/space.json")
-def space_api(space_name: str, session: SessionDep):
-    space = session.exec(select(Space).where(Space.name == space_name)).first()
-    if not space:
-        raise HTTPException(status_code=404, detail="Space not found")
-    latest_event = session.exec(
-        select(SpaceEvent).where(SpaceEvent.space_id ==
-                                 space.id).order_by(SpaceEvent.timestamp.desc())
-    ).first()
-    state = latest_event.state if latest_event else SpaceEventState.UNKNOWN
-    return {
-        "api_compatibility": ["15"],
-        "space": space.name,
-        "logo": space.logo,
-        "url": space.url,
-        "location": {
-            "address": space.address,
-            "lat": space.lat,
-            "lon": space.lon
-        },
-        "state": {
+async def space_api(space_name: str, request: Request, response: Response, session: SessionDep):
+    cached = _space_api_cache.get(space_name)
+    if cached and cached[0] > time.monotonic():
+        _, etag, body = cached
+    else:
+        space = await get_space_by_name(session, space_name)
+        if not space:
+            raise HTTPException(status_code=404, detail="Space not found")
+        latest_event = None
+        if space.latest_event_id:
+            latest_event = await session.get(SpaceEvent, space.latest_event_id)
+        if latest_event is None:
+            # Fall back to the index walk for events written before the
+            # latest-event pointer existed
+            latest_event = await session.scalar(
+                select(SpaceEvent).where(SpaceEvent.space_id == space.id)
+                .order_by(SpaceEvent.timestamp.desc()).limit(1))
+        etag = make_etag(space.id, latest_event)
+        state = latest_event.state if latest_event else SpaceEventState.UNKNOWN
+        body = get_space_skeleton(space).copy()
+        body["state"] = {
             "open": state == SpaceEventState.OPEN,
             "lastchange": int(latest_event.timestamp.timestamp()) if latest_event else None
-        },
-        "contact": {
-            "email": space.contact_email
         }
-    }
+        _space_api_cache[space_name] = (
+            time.monotonic() + SPACE_API_CACHE_TTL, etag, body)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return body
@@ -1,7 +1,11 @@
 import typer
 from getpass import getpass
-from sqlmodel import Session, select
-from main import Space, hash_password, engine
+from sqlmodel import Session, create_engine, select
+from main import Space, hash_password, sqlite_file_name
+
+# The app uses an async engine; the CLI keeps a plain sync one on the
+# same database file
+engine = create_engine(f"sqlite:///{sqlite_file_name}")
 
 app = typer.Typer()
 
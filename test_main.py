@@ -1,26 +1,38 @@
+import asyncio
 import json
 import os
+import sqlite3
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel, create_engine, select, text
-from main import SpaceEvent, app, Space, hash_password
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, create_engine, delete
+from sqlmodel.ext.asyncio.session import AsyncSession
+import main
+from main import (SpaceEvent, SpaceEventState, app, Space, _space_api_cache,
+                  _space_by_id, _space_by_name, _space_skeleton)
 from jsonschema import validate
 
 TEST_DB = "sqlite:///test_database.db"
+TEST_ASYNC_DB = "sqlite+aiosqlite:///test_database.db"
+
+# Precomputed argon2id hash of "testpass" so the fixture doesn't pay the
+# memory-hard hashing cost before every test
+TEST_PASSWORD_HASH = "$argon2id$v=19$m=19456,t=2,p=1$73QsIPPJ87chz4nsO/Jx1w$cjRPnCCZaPg2QQP3/L8TMTVAaRjWW4rd15lbGhvJs8A"
 
 
 @pytest.fixture(scope="session", autouse=True)
 def test_db():
-    # Set up test database
+    # Set up test database (sync engine for fixtures, async for the app)
     engine = create_engine(TEST_DB, connect_args={"check_same_thread": False})
     SQLModel.metadata.create_all(engine)
+    async_engine = create_async_engine(TEST_ASYNC_DB)
     # Patch app's engine to use test engine
     app.dependency_overrides = {}
     app.state._engine = engine
 
     # Provide a get_session override
-    def get_session_override():
-        with Session(engine) as session:
+    async def get_session_override():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
             yield session
     app.dependency_overrides = {}
     app.dependency_overrides[getattr(__import__(
@@ -36,13 +48,17 @@ def test_db():
 
 @pytest.fixture(autouse=True)
 def setup_space(test_db):
+    # Each test gets a fresh space, so drop anything cached for it
+    _space_api_cache.clear()
+    _space_by_id.clear()
+    _space_by_name.clear()
+    _space_skeleton.clear()
     # Create a test space before each test
     with Session(test_db) as session:
-        # Get all spaces and delete them
-        for space in session.exec(select(Space)).all():
-            session.delete(space)
-        for space_event in session.exec(select(SpaceEvent)).all():
-            session.delete(space_event)
+        # Clear both tables with two bulk DELETEs instead of loading and
+        # deleting every row through the ORM
+        session.exec(delete(SpaceEvent))
+        session.exec(delete(Space))
         session.commit()
         space = Space(
             name="TestSpace",
@@ -52,7 +68,7 @@ def setup_space(test_db):
             lat="45.0",
             lon="90.0",
             contact_email="test@example.org",
-            basic_auth_password=hash_password("testpass")
+            basic_auth_password=TEST_PASSWORD_HASH
         )
         session.add(space)
         session.commit()
@@ -139,3 +155,97 @@ def test_space_api_schema():
         validate(instance=data, schema=schema_json)
     except Exception as e:
         pytest.fail(f"JSON schema validation failed: {e}")
+
+
+def test_send_telegram_message(test_db, monkeypatch):
+    # Create a Telegram-enabled space and an event, then run the helper
+    # against rows loaded fresh from the DB
+    with Session(test_db) as session:
+        space = Space(
+            name="TelegramSpace",
+            logo="http://example.org/logo.png",
+            url="http://example.org",
+            address="123 Test St",
+            lat="45.0",
+            lon="90.0",
+            contact_email="test@example.org",
+            basic_auth_password=TEST_PASSWORD_HASH,
+            telegram_enabled=True,
+            telegram_bot_token="dummy-token",
+            telegram_channel_id="@dummy_channel"
+        )
+        session.add(space)
+        session.commit()
+        session.refresh(space)
+        event = SpaceEvent(space_id=space.id, state=SpaceEventState.OPEN)
+        session.add(event)
+        session.commit()
+        session.refresh(event)
+        space_id, event_id = space.id, event.id
+
+    calls = []
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"ok": True, "result": {"message_id": 42}}
+
+    class FakeTelegramClient:
+        async def post(self, url, data=None):
+            calls.append((url, data))
+            return FakeResponse()
+
+    monkeypatch.setattr(main, "engine", create_async_engine(TEST_ASYNC_DB))
+    monkeypatch.setattr(main, "_telegram_client", FakeTelegramClient())
+    asyncio.run(main.send_telegram_message(space_id, event_id))
+
+    assert len(calls) == 1
+    assert calls[0][1]["text"] == "'TelegramSpace' door is open."
+    # The Telegram message id must be stored on the event
+    with Session(test_db) as session:
+        assert session.get(SpaceEvent, event_id).telegram_message_id == 42
+
+
+def test_legacy_state_migration(tmp_path, monkeypatch):
+    # Build a database with the baseline schema: TEXT state column
+    # holding enum member names, no latest_event_id on space
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE space (id INTEGER PRIMARY KEY, name VARCHAR, logo VARCHAR, "
+        "url VARCHAR, address VARCHAR, lat FLOAT, lon FLOAT, contact_email VARCHAR, "
+        "telegram_channel_id VARCHAR, telegram_enabled BOOLEAN, "
+        "basic_auth_password VARCHAR, telegram_bot_token VARCHAR)")
+    conn.execute(
+        "CREATE TABLE spaceevent (id INTEGER PRIMARY KEY, space_id INTEGER, "
+        "timestamp DATETIME, state VARCHAR, telegram_message_id INTEGER)")
+    conn.execute("CREATE INDEX ix_spaceevent_timestamp ON spaceevent (timestamp)")
+    conn.execute(
+        "INSERT INTO spaceevent (space_id, timestamp, state, telegram_message_id) "
+        "VALUES (1, '2025-01-01', 'OPEN', 7), (1, '2025-01-02', 'CLOSED', NULL), "
+        "(1, '2025-01-03', 'UNKNOWN', NULL)")
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(
+        main, "engine", create_async_engine(f"sqlite+aiosqlite:///{db_path}"))
+
+    async def run_migration():
+        await main.create_db_and_tables()
+        await main.create_db_and_tables()  # must be idempotent
+        await main.engine.dispose()
+    asyncio.run(run_migration())
+
+    conn = sqlite3.connect(db_path)
+    rows = list(conn.execute(
+        "SELECT state, typeof(state), telegram_message_id FROM spaceevent ORDER BY id"))
+    space_columns = [row[1] for row in conn.execute("PRAGMA table_info(space)")]
+    conn.close()
+    assert rows == [
+        (int(SpaceEventState.OPEN), "integer", 7),
+        (int(SpaceEventState.CLOSED), "integer", None),
+        (int(SpaceEventState.UNKNOWN), "integer", None),
+    ]
+    assert "latest_event_id" in space_columns